@@ -1,10 +1,15 @@
 #!/usr/bin/env python
+import asyncio
+import functools
 import hashlib
-import json
 import os
 import re
 import sys
+import tempfile
+import time
 
+from concurrent.futures import ThreadPoolExecutor
+from html import unescape
 from io import BytesIO
 from ricecooker.utils import downloader, html_writer
 from ricecooker.chefs import SushiChef
@@ -13,6 +18,9 @@ from ricecooker.config import LOGGER              # Use LOGGER to print messages
 from ricecooker.exceptions import raise_for_invalid_channel
 from le_utils.constants import exercises, content_kinds, file_formats, format_presets, languages
 
+import aiohttp
+import img2pdf
+import orjson
 from bs4 import BeautifulSoup
 from PIL import Image
 
@@ -32,15 +40,44 @@ CHANNEL_THUMBNAIL = "https://pbs.twimg.com/profile_images/989193568752300032/UQp
 ################################################################################
 # Folder to store pdfs of images
 DOCUMENT_DOWNLOAD_DIR = 'documents'
-if not os.path.exists(DOCUMENT_DOWNLOAD_DIR):
-    os.makedirs(DOCUMENT_DOWNLOAD_DIR)
+
+# Folder to cache downloaded content between runs
+CACHE_DIR = os.path.join(DOCUMENT_DOWNLOAD_DIR, '.cache')
+os.makedirs(CACHE_DIR, exist_ok=True)     # Also creates DOCUMENT_DOWNLOAD_DIR
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+CACHE_TTL = 24 * 60 * 60    # Seconds to keep pages and api responses (images never expire)
+
+# Checkpoint of scraped topics, so an interrupted run can pick up where it left off (removed once a run completes)
+STATE_PATH = os.path.join(DOCUMENT_DOWNLOAD_DIR, '.state.json')
+
+# Images that can't be embedded in pdfs as is are downsampled to fit within this size and re-encoded
+MAX_IMAGE_SIZE = (1600, 1600)
+PDF_IMAGE_QUALITY = 85
+PDF_PAGE_CACHE_SIZE = 128   # Number of re-encoded images to keep for reuse across slideshows
+
+# Shared by every slideshow so at most one image per cpu is decoded at a time
+IMAGE_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count())
 
 # Main page collection brandfolder
 ENGLISH_COLLECTION_URL = "https://brandfolder.com/digitalmedic/covid-19"
 ENGLISH_ASSETS_URL = "https://brandfolder.com/api/v4/collections/{collection}/sections/{section}/assets?sort_by=position&order=ASC&search=&fast_jsonapi=true"
+INCLUDE_ATTACHMENTS = "&include=attachments"    # Only added when fetching, as asset urls are also used as source ids
 EXCLUDED_TOPIC_IDS = [262354, 261412]
+COLLECTION_KEY_RE = re.compile(r'var SOURCE\s*=\s*\{[^}]*?resource_key:\s*"([^"]+)"')
+REACT_PROPS_RE = re.compile(r'class="asset-list"[^>]*>\s*<div[^>]*data-react-props="([^"]+)"')
 FILE_STORAGE_URL = "https://brandfolder.com/api/v4/assets/{id}/attachments?fields=url,thumbnail_url"
 
+# Maximum number of simultaneous requests to brandfolder
+MAX_CONCURRENT_REQUESTS = 16
+DOWNLOAD_HEADERS = {    # Same headers as ricecooker's downloader
+    "User-Agent": "Mozilla/5.0 (Windows NT 6.1; WOW64; rv:20.0) Gecko/20100101 Firefox/20.0",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=60, sock_read=60)
+DOWNLOAD_RETRIES = 5
+DOWNLOADS = {}      # Download tasks by url, so each url is only fetched once per run
+
 # Multi-language content constants
 SLIDESHOWS_URL = "https://brandfolder.com/digitalmedic/covid-19-multiple-languages"
 SLIDESHOW_ASSETS_URL = "https://brandfolder.com/api/v4/collections/{collection}/sections/{section}/assets?sort_by=position&order=ASC&strict_search=false&fast_jsonapi=true"
@@ -103,145 +140,439 @@ class StanfordDigitalMedicChef(SushiChef):
         """
         channel = self.get_channel(*args, **kwargs)  # Create ChannelNode from data in self.channel_info
 
-        scrape_english_collection(channel)
-        scrape_multilanguage_slideshows(channel)
+        asyncio.run(scrape_channel(channel))
 
         return channel
 
 # HELPER FUNCTIONS
 ################################################################################
-def get_collection_key(contents):
-    return re.search(r"var SOURCE\s*=\s*\{.+, resource_key: \"(.+)\"[^\}]+", contents.text).group(1)
+def get_collection_key(html):
+    return COLLECTION_KEY_RE.search(html).group(1)
+
+
+def get_react_props(html):
+    """ Returns the data-react-props of the asset list on a brandfolder page """
+    match = REACT_PROPS_RE.search(html)
+    if match:
+        return orjson.loads(unescape(match.group(1)))
+
+    # Fall back to parsing the whole page if the markup doesn't look as expected
+    contents = BeautifulSoup(html, 'lxml')
+    return orjson.loads(contents.find('div', {'class': 'asset-list'}).find('div')['data-react-props'])
 
 
-def create_slideshow(images, source_id, title, language_name):
+@functools.lru_cache(maxsize=None)
+def get_language_name(language_name):
+    """ Returns native name of language_name (or language_name if it has no language code) """
+    code = LANGUAGE_MAP[language_name]
+    return languages.getlang(code).native_name if code else language_name
+
+
+def get_included_attachments(response):
     """
-        images: {url: str, caption: str}
+        Map asset ids to the attributes of their first attachment, using the
+        `included` section of a json:api response requested with include=attachments
+    """
+    included = {(item['type'], item['id']): item['attributes'] for item in response.get('included', [])}
+    attachments = {}
+    for asset in response['data']:
+        related = asset.get('relationships', {}).get('attachments', {}).get('data') or []
+        for ref in related:
+            attributes = included.get((ref['type'], ref['id']))
+            if attributes and attributes.get('url') and attributes.get('thumbnail_url'):
+                attachments[asset['id']] = attributes
+                break
+    return attachments
+
+
+async def download(session, semaphore, url, ttl=None):
+    """
+        Stream the contents of url into CACHE_DIR, allowing at most MAX_CONCURRENT_REQUESTS at once
+        Cached files are reused for ttl seconds (or forever if ttl is None)
+        Concurrent calls for the same url share a single download
+        Returns path to the cached file
     """
+    if url not in DOWNLOADS:
+        DOWNLOADS[url] = asyncio.ensure_future(_download(session, semaphore, url, ttl))
+    # Shield the shared download so one caller being cancelled doesn't cancel it for the others
+    return await asyncio.shield(DOWNLOADS[url])
+
+
+async def _download(session, semaphore, url, ttl):
+    cachepath = os.path.join(CACHE_DIR, hashlib.sha1(url.encode('utf-8')).hexdigest())
+    if os.path.exists(cachepath) and (ttl is None or time.time() - os.path.getmtime(cachepath) < ttl):
+        return cachepath
+
+    retry_count = 0
+    while True:
+        try:
+            await _stream_to_file(session, semaphore, url, cachepath)
+            return cachepath
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # Retry connection problems and server errors, but not responses like 404
+            if (isinstance(e, aiohttp.ClientResponseError) and e.status < 500) or retry_count >= DOWNLOAD_RETRIES:
+                raise
+            retry_count += 1
+            LOGGER.warning("Error with connection ('{msg}'); about to perform retry {count} of {trymax}."
+                .format(msg=str(e) or type(e).__name__, count=retry_count, trymax=DOWNLOAD_RETRIES))
+            await asyncio.sleep(retry_count)
+
+
+async def _stream_to_file(session, semaphore, url, path):
+    # Only open the file once a slot is free, so queued downloads don't hold file descriptors
+    async with semaphore:
+        # Write to a temporary file first so an interrupted run never leaves a partial cache entry
+        with tempfile.NamedTemporaryFile(dir=CACHE_DIR, suffix='.tmp', delete=False) as fobj:
+            try:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        fobj.write(chunk)
+            except BaseException:
+                fobj.close()
+                os.remove(fobj.name)
+                raise
+        os.replace(fobj.name, path)
+
+
+async def fetch(session, semaphore, url, ttl=None):
+    """ Read the contents of url (see `download`) """
+    with open(await download(session, semaphore, url, ttl=ttl), 'rb') as fobj:
+        return fobj.read()
+
+
+def can_embed_image(path):
+    """ Returns True if img2pdf can put the image at path in a pdf without re-encoding it """
+    with Image.open(path) as img:   # Only reads the image header
+        return img.format in ('PNG', 'JPEG') and img.mode in ('L', 'RGB')
+
+
+def decode_image(path):
+    """ Decode image file into an opaque PIL image that can be written to a pdf """
+    img = Image.open(path)
+    if img.format == 'JPEG':
+        # Let libjpeg decode at a reduced scale rather than decoding full size and shrinking
+        img.draft('RGB', MAX_IMAGE_SIZE)
+    img.load()
+    if img.mode not in ('L', 'RGB', 'RGBA'):
+        img = img.convert('RGBA')
+    if img.mode == 'RGBA':
+        # Flatten onto white so transparent areas don't come out black in the pdf
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[3])
+        img = background
+    img.thumbnail(MAX_IMAGE_SIZE, Image.LANCZOS)
+    return img
+
+
+@functools.lru_cache(maxsize=PDF_PAGE_CACHE_SIZE)
+def get_pdf_page(path):
+    """
+        Returns the image at path in a form img2pdf accepts: the path itself if the
+        file can be embedded as is, otherwise the flattened image encoded as a JPEG
+    """
+    if can_embed_image(path):
+        return path
+
+    page = BytesIO()
+    decode_image(path).save(page, 'JPEG', optimize=True, quality=PDF_IMAGE_QUALITY)
+    return page.getvalue()
+
 
-    thumbnailFile = files.ThumbnailFile(images[0]['url'])
+async def write_pdf(image_paths, pdfpath):
+    # Prepare pages off the event loop so other topics can keep downloading
+    # PIL releases the GIL while decoding, so any images that need flattening can be decoded in parallel
+    loop = asyncio.get_running_loop()
+    pages = await asyncio.gather(*[
+        loop.run_in_executor(IMAGE_EXECUTOR, get_pdf_page, path)
+        for path in image_paths
+    ])
+
+    pdf = await loop.run_in_executor(IMAGE_EXECUTOR, img2pdf.convert, list(pages))
+    with open(pdfpath, 'wb') as fobj:
+        fobj.write(pdf)
+
+
+async def create_slideshow(session, semaphore, images, source_id, title, language_name):
+    """
+        images: {url: str, caption: str}
+        Returns manifest for the slideshow (see `create_node`)
+    """
+    manifest = {
+        'source_id': source_id,
+        'title': title,
+        'language': LANGUAGE_MAP[language_name],
+        'thumbnail': images[0]['url'],
+    }
 
     if '--slides' in sys.argv:
+        manifest.update(kind='slideshow', images=images)
+        return manifest
+
+    # Create PDF, named after the images it contains so it's rebuilt whenever they change
+    filename = hashlib.blake2b(b'\n'.join(image['url'].encode('utf-8') for image in images), digest_size=16).hexdigest()
+    pdfpath = '{}{}{}.pdf'.format(DOCUMENT_DOWNLOAD_DIR, os.path.sep, filename)
+
+    if not os.path.exists(pdfpath):
+        image_paths = await asyncio.gather(*[download(session, semaphore, image['url']) for image in images])
+        await write_pdf(image_paths, pdfpath)
+
+    manifest.update(kind='document', pdfpath=pdfpath)
+    return manifest
+
+
+def create_node(manifest):
+    """
+        Returns node described by manifest, a dict with the keys
+          - kind: 'video', 'slideshow' or 'document'
+          - source_id, title, thumbnail (url)
+          - url: video url (videos only)
+          - language: language code (slideshows and documents only)
+          - images: {url: str, caption: str} (slideshows only)
+          - pdfpath: path to pdf of the images (documents only)
+    """
+    thumbnailFile = files.ThumbnailFile(manifest['thumbnail'])
+
+    if manifest['kind'] == 'video':
+        return nodes.VideoNode(
+            source_id=manifest['source_id'],
+            title=manifest['title'],
+            license=LICENSE,
+            files=[
+                files.VideoFile(manifest['url']),
+                thumbnailFile
+            ]
+        )
+
+    if manifest['kind'] == 'slideshow':
         slides = [
             files.SlideImageFile(image['url'], caption=image.get('caption', ''))
-            for image in images
+            for image in manifest['images']
         ]
         return nodes.SlideshowNode(
-            source_id=source_id,
-            title=title,
+            source_id=manifest['source_id'],
+            title=manifest['title'],
             license=LICENSE,
-            language=LANGUAGE_MAP[language_name],
+            language=manifest['language'],
             files=[thumbnailFile] + slides
         )
 
-    # Create PDF
-    filename = hashlib.md5(source_id.encode('utf-8')).hexdigest()
-    pdfpath = '{}{}{}.pdf'.format(DOCUMENT_DOWNLOAD_DIR, os.path.sep, filename)
-
-    if not os.path.exists(pdfpath):
-        image_list = []
-        for image in images:
-            img = Image.open(BytesIO(downloader.read(image['url'])))
-            if img.mode == 'RGBA':
-                img = img.convert('RGB')
-            image_list.append(img)
-
-        image_list[0].save(pdfpath, save_all=True, append_images=image_list[1:])
-
     return nodes.DocumentNode(
-        source_id=source_id,
-        title=title,
+        source_id=manifest['source_id'],
+        title=manifest['title'],
         license=LICENSE,
-        language=LANGUAGE_MAP[language_name],
-        files=[thumbnailFile, files.DocumentFile(pdfpath)]
+        language=manifest['language'],
+        files=[thumbnailFile, files.DocumentFile(manifest['pdfpath'])]
     )
 
 
+def load_state():
+    """ Returns checkpointed manifests by topic url (empty if this is a fresh run) """
+    if not os.path.exists(STATE_PATH):
+        return {}
+    with open(STATE_PATH, 'rb') as fobj:
+        return orjson.loads(fobj.read())
+
+
+def save_state(state):
+    # Write to a temporary file first so an interrupted run never leaves a partial checkpoint
+    tmppath = '{}.tmp'.format(STATE_PATH)
+    with open(tmppath, 'wb') as fobj:
+        fobj.write(orjson.dumps(state))
+    os.replace(tmppath, STATE_PATH)
+
+
+def can_reuse(manifests):
+    """ Returns True if checkpointed manifests match this run's options and their pdfs still exist """
+    for manifest in manifests:
+        if manifest['kind'] == 'slideshow' and '--slides' not in sys.argv:
+            return False
+        if manifest['kind'] == 'document' and ('--slides' in sys.argv or not os.path.exists(manifest['pdfpath'])):
+            return False
+    return True
+
+
+async def scrape_checkpointed(state, url, scrape):
+    """
+        Returns nodes for the topic at url, reusing its checkpoint or awaiting scrape()
+        for its manifests and whether they're complete (only complete topics are checkpointed)
+    """
+    if url in state and can_reuse(state[url]):
+        manifests = state[url]
+    else:
+        manifests, complete = await scrape()
+        if complete:
+            state[url] = manifests
+            save_state(state)
+    return [create_node(manifest) for manifest in manifests]
+
+
 
 # SCRAPING FUNCTIONS
 ################################################################################
-def scrape_english_collection(channel):
+async def scrape_channel(channel):
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    state = load_state()
+    async with aiohttp.ClientSession(headers=DOWNLOAD_HEADERS, timeout=DOWNLOAD_TIMEOUT) as session:
+        await scrape_english_collection(channel, session, semaphore, state)
+        await scrape_multilanguage_slideshows(channel, session, semaphore, state)
+
+    # The checkpoint is only for resuming interrupted runs; the next full run should rescrape everything
+    if os.path.exists(STATE_PATH):
+        os.remove(STATE_PATH)
+
+
+async def scrape_english_collection(channel, session, semaphore, state):
     LOGGER.info('Scraping English collection...')
     english_topic = nodes.TopicNode(source_id=ENGLISH_COLLECTION_URL, title="English")
     channel.add_child(english_topic)
 
 
-    contents = BeautifulSoup(downloader.read(ENGLISH_COLLECTION_URL), 'html5lib')
-    collection_key = get_collection_key(contents)
+    html = (await fetch(session, semaphore, ENGLISH_COLLECTION_URL, ttl=CACHE_TTL)).decode('utf-8')
+    collection_key = get_collection_key(html)
 
-    topic_selection = contents.find('div', {'class': 'asset-list'}).find('div')
-    topic_list = [t for t in json.loads(topic_selection['data-react-props'])['sections'] if t['id'] not in EXCLUDED_TOPIC_IDS]
+    topic_list = [t for t in get_react_props(html)['sections'] if t['id'] not in EXCLUDED_TOPIC_IDS]
 
+    topic_nodes = []
+    topic_urls = []
     for topic in topic_list:
         LOGGER.info('    {}'.format(topic['name'].encode('utf-8')))
         topic_node = nodes.TopicNode(source_id=topic['section_key'], title=topic['name'])
         english_topic.add_child(topic_node)
+        topic_nodes.append(topic_node)
+        topic_urls.append(ENGLISH_ASSETS_URL.format(collection=collection_key, section=topic['section_key']))
 
-        # Scrape items in the topic
-        url = ENGLISH_ASSETS_URL.format(collection=collection_key, section=topic['section_key'])
-        scrape_collection_files(topic_node, url)
-
-
-def scrape_collection_files(topic, url):
-    assets = json.loads(downloader.read(url))['data']
-    images = []
-    for asset in assets:
-        if asset['attributes']['extension'] == 'png':
-            images.append({
-                'url': asset['attributes']['thumbnail_url'].replace('element.png', 'view@2x.png'),
-                'caption': asset['attributes']['name']
-            })
-
-        elif asset['attributes']['extension'] == 'mp4':
-            video_data = json.loads(downloader.read(FILE_STORAGE_URL.format(id=asset['id'])))
-            video = video_data['data'][0]['attributes']
-            topic.add_child(nodes.VideoNode(
-                source_id=video['url'],
-                title=asset['attributes']['name'],
-                license=LICENSE,
-                files=[
-                    files.VideoFile(video['url']),
-                    files.ThumbnailFile(video['thumbnail_url'])
-                ]
-            ))
-        else:
-            LOGGER.warning('Unable to add {} from {}'.format(asset['attributes']['extension'], url))
+    # Topics are independent, so scrape all of them at once
+    topic_children = await asyncio.gather(*[
+        scrape_checkpointed(
+            state,
+            url,
+            functools.partial(scrape_collection_files, topic_node.title, url, session, semaphore)
+        )
+        for topic_node, url in zip(topic_nodes, topic_urls)
+    ])
+    for topic_node, children in zip(topic_nodes, topic_children):
+        for child in children:
+            topic_node.add_child(child)
+
+
+async def scrape_collection_files(title, url, session, semaphore):
+    """
+        Returns list of manifests for the assets in the topic at url (see `create_node`),
+        and False if any of them had to be skipped because of an error
+    """
+    response = orjson.loads(await fetch(session, semaphore, url + INCLUDE_ATTACHMENTS, ttl=CACHE_TTL))
+    assets = response['data']
+    attachments = get_included_attachments(response)
+    children = []
+    complete = True
+
+    # Split assets by extension in one pass, then build each kind from its own list
+    attributes = [asset['attributes'] for asset in assets]
+    extensions = [attrs['extension'] for attrs in attributes]
+    png_indices = [i for i, extension in enumerate(extensions) if extension == 'png']
+    mp4_indices = [i for i, extension in enumerate(extensions) if extension == 'mp4']
+    for extension in extensions:
+        if extension not in ('png', 'mp4'):
+            LOGGER.warning('Unable to add {} from {}'.format(extension, url))
+
+    images = [
+        {
+            'url': attributes[i]['thumbnail_url'].replace('element.png', 'view@2x.png'),
+            'caption': attributes[i]['name']
+        }
+        for i in png_indices
+    ]
+    videos = [assets[i] for i in mp4_indices]
+
+    # Look up any video attachments that weren't included in the response concurrently
+    missing = [asset for asset in videos if asset['id'] not in attachments]
+    video_data = await asyncio.gather(
+        *[fetch(session, semaphore, FILE_STORAGE_URL.format(id=asset['id']), ttl=CACHE_TTL) for asset in missing],
+        return_exceptions=True
+    )
+    for asset, data in zip(missing, video_data):
+        if isinstance(data, Exception):
+            LOGGER.warning('Unable to add {} from {}: {}'.format(asset['attributes']['name'], url, data))
+            complete = False
+            continue
+        attachments[asset['id']] = orjson.loads(data)['data'][0]['attributes']
+
+    for asset in videos:
+        if asset['id'] not in attachments:
+            continue
+        video = attachments[asset['id']]
+        children.append({
+            'kind': 'video',
+            'source_id': video['url'],
+            'title': asset['attributes']['name'],
+            'url': video['url'],
+            'thumbnail': video['thumbnail_url'],
+        })
 
     # Add images to slideshow node
     if len(images):
-        topic.add_child(create_slideshow(
+        children.append(await create_slideshow(
+            session,
+            semaphore,
             images,
             url,
-            topic.title,
+            title,
             'English'
         ))
 
+    return children, complete
 
-def scrape_multilanguage_slideshows(channel):
-    LOGGER.info('Scraping multi-language content...')
-    contents = BeautifulSoup(downloader.read(SLIDESHOWS_URL), 'html5lib')
-    collection_key = get_collection_key(contents)
 
-    languages_selection = contents.find('div', {'class': 'asset-list'}).find('div')
-    language_list = json.loads(languages_selection['data-react-props'])['sections']
+async def scrape_multilanguage_slideshows(channel, session, semaphore, state):
+    LOGGER.info('Scraping multi-language content...')
+    html = (await fetch(session, semaphore, SLIDESHOWS_URL, ttl=CACHE_TTL)).decode('utf-8')
+    collection_key = get_collection_key(html)
+
+    language_list = get_react_props(html)['sections']
+
+    # Languages are independent, so scrape all of them at once
+    asset_urls = [
+        SLIDESHOW_ASSETS_URL.format(collection='qac6i4-foozd4-68u325', section=language['section_key'])
+        for language in language_list
+    ]
+    slideshows = await asyncio.gather(*[
+        scrape_checkpointed(
+            state,
+            asset_url,
+            functools.partial(scrape_language_slideshow, language, asset_url, session, semaphore)
+        )
+        for language, asset_url in zip(language_list, asset_urls)
+    ])
+    for language_nodes in slideshows:
+        for slideshow in language_nodes:
+            channel.add_child(slideshow)
 
-    for language in language_list:
-        asset_url = SLIDESHOW_ASSETS_URL.format(collection='qac6i4-foozd4-68u325', section=language['section_key'])
-        slide_data = json.loads(downloader.read(asset_url))['data']
-        translated_name = languages.getlang(LANGUAGE_MAP[language['name']]).native_name if LANGUAGE_MAP[language['name']] else language['name']
-        LOGGER.info('    {}'.format(translated_name.encode('utf-8')))
 
-        slides = [
-            { 'url': slide['attributes']['thumbnail_url'].replace('element.png', 'view@2x.png')}
-            for slide in slide_data
-        ]
-        if len(slides):
-            channel.add_child(create_slideshow(
-                slides,
-                asset_url,
-                translated_name,
-                language['name']
-            ))
+async def scrape_language_slideshow(language, asset_url, session, semaphore):
+    """
+        Returns list of manifests for the language's slideshow (empty if it has no slides),
+        and True as any error fetching the slideshow is raised rather than skipped
+    """
+    slide_data = orjson.loads(await fetch(session, semaphore, asset_url, ttl=CACHE_TTL))['data']
+    translated_name = get_language_name(language['name'])
+    LOGGER.info('    {}'.format(translated_name.encode('utf-8')))
+
+    slides = [
+        { 'url': slide['attributes']['thumbnail_url'].replace('element.png', 'view@2x.png')}
+        for slide in slide_data
+    ]
+    if not len(slides):
+        return [], True
+
+    return [await create_slideshow(
+        session,
+        semaphore,
+        slides,
+        asset_url,
+        translated_name,
+        language['name']
+    )], True
 
 
 # CLI